@@ -0,0 +1,49 @@
+# coding: utf-8
+"""
+Benchmark validation of long arrays with a single `number` or `string` item schema.
+
+    python -m benchmarks.bench_homogeneous_items
+
+"""
+
+import random
+import timeit
+
+from jsonschema import Draft4Validator
+
+from jsonschemaoop.JSONSchemaOOP import JSONArray, JSONNumber, JSONString
+from jsonschemaoop.validators import JSONSchemaValidator
+
+SIZE = 100000
+
+CASES = (
+    (
+        'number',
+        JSONArray(items=JSONNumber(minimum=-50, maximum=150, multiple_of=0.5)),
+        lambda rng: [rng.randint(-100, 300) / 2.0 for _ in range(SIZE)],
+    ),
+    (
+        'string',
+        JSONArray(items=JSONString(max_length=16)),
+        lambda rng: ['tag-{}'.format(rng.randint(0, 10 ** 6)) for _ in range(SIZE)],
+    ),
+)
+
+
+def bench(validator, data):
+    return min(timeit.repeat(lambda: validator.validate(data), number=1, repeat=3))
+
+
+def main():
+    rng = random.Random(0)
+    print('{:>8} {:>14} {:>14}'.format('schema', 'bulk [s]', 'per item [s]'))
+    for name, array, make_data in CASES:
+        schema = array.render()
+        data = make_data(rng)
+        print('{:>8} {:>14.4f} {:>14.4f}'.format(
+            name, bench(JSONSchemaValidator(schema), data), bench(Draft4Validator(schema), data)
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# coding: utf-8
+"""
+Benchmark the import time of the package with `python -X importtime`.
+
+    python -m benchmarks.bench_import_time
+
+The budget is checked in `tests/test_import_time.py`.
+
+"""
+
+import subprocess
+import sys
+
+MODULE = 'jsonschemaoop.JSONSchemaOOP'
+IMPORT_TIME_BUDGET_US = 25000
+
+
+def import_times(module=MODULE):
+    """
+    Import `module` in a fresh interpreter and return
+    `{name: (self_us, cumulative_us, depth)}` of every imported module.
+
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+        stderr=subprocess.STDOUT,
+    ).decode('utf-8')
+
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return times
+
+
+def package_import_time(times):
+    """
+    Sum the cumulative time of the top level imports of this package.
+
+    """
+    return sum(
+        cumulative for name, (_, cumulative, depth) in times.items()
+        if depth == 0 and name.split('.')[0] == 'jsonschemaoop'
+    )
+
+
+def main():
+    times = import_times()
+    total = package_import_time(times)
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:10]
+
+    print('import {}: {} us (budget {} us)'.format(MODULE, total, IMPORT_TIME_BUDGET_US))
+    for name, (self_us, cumulative_us, _) in slowest:
+        print('{:>10} {:>10}  {}'.format(self_us, cumulative_us, name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# coding: utf-8
+"""
+Benchmark `uniqueItems` on arrays of objects, floats and strings.
+
+    python -m benchmarks.bench_unique_items
+
+The pairwise check of `jsonschema` is only measured on small arrays of
+objects, it is quadratic for unhashable items.
+
+"""
+
+import timeit
+
+from jsonschema._utils import uniq
+
+from jsonschemaoop.validators import find_duplicate
+
+SIZES = (1000, 100000, 1000000)
+PAIRWISE_MAX_SIZE = 1000
+
+
+CASES = (
+    ('objects', lambda size: [{'id': i, 'active': i % 2 == 0, 'tags': [i, str(i)]}
+                              for i in range(size)]),
+    ('floats', lambda size: [i / 2.0 for i in range(size)]),
+    ('strings', lambda size: ['tag-{}'.format(i) for i in range(size)]),
+)
+
+
+def bench(func, items, number=1):
+    return min(timeit.repeat(lambda: func(items), number=number, repeat=3)) / number
+
+
+def main():
+    print('{:>8} {:>10} {:>14} {:>14}'.format('type', 'items', 'hashed [s]', 'jsonschema [s]'))
+    for name, make_items in CASES:
+        for size in SIZES:
+            items = make_items(size)
+            hashed = bench(find_duplicate, items)
+            # jsonschema's uniq() is quadratic for unhashable items
+            unhashable = isinstance(items[0], dict) and size > PAIRWISE_MAX_SIZE
+            baseline = None if unhashable else bench(uniq, items)
+            print('{:>8} {:>10} {:>14.4f} {:>14}'.format(
+                name, size, hashed, '-' if baseline is None else '{:.4f}'.format(baseline)
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# coding: utf-8
+"""
+Benchmark payload generation and validation of generated payloads.
+
+    python -m benchmarks.bench_validate
+
+"""
+
+import timeit
+
+from jsonschemaoop.JSONSchemaOOP import JSONArray, JSONEnum, JSONNumber, JSONObject, \
+    JSONSchema, JSONSchemaReference, JSONString
+from jsonschemaoop.generator import PayloadGenerator
+
+COUNT = 10000
+SEED = 0
+
+
+class ReadingJSONSchemaObject(JSONObject):
+    required = ['sensor', 'values']
+    properties = {
+        'sensor': JSONString(min_length=4, max_length=12),
+        'unit': JSONEnum(['celsius', 'kelvin']),
+        'values': JSONArray(items=JSONNumber(minimum=-50, maximum=150, multiple_of=0.5),
+                            min_items=10, max_items=100),
+    }
+
+
+class ReadingsSchema(JSONSchema):
+    required = ['device', 'readings']
+    properties = {
+        'device': JSONString(format=JSONString.FORMAT_HOST_NAME),
+        'tags': JSONArray(items=JSONString(max_length=16), unique_items=True, max_items=20),
+        'readings': JSONArray(items=JSONSchemaReference('reading'), min_items=1, max_items=10),
+    }
+    definitions = {
+        'reading': ReadingJSONSchemaObject()
+    }
+
+
+def per_second(func, count):
+    return count / min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main():
+    schema = ReadingsSchema()
+    generator = PayloadGenerator(schema, seed=SEED)
+
+    valid = generator.generate_many(COUNT)
+    invalid = [generator.generate_invalid()[1] for _ in range(COUNT)]
+
+    def validate_all(payloads):
+        for data in payloads:
+            try:
+                schema.validate(data)
+            except Exception:
+                pass
+
+    print('generate valid   {:>10.0f} payloads/s'.format(
+        per_second(lambda: generator.generate_many(COUNT), COUNT)))
+    print('generate invalid {:>10.0f} payloads/s'.format(
+        per_second(lambda: [generator.generate_invalid() for _ in range(COUNT)], COUNT)))
+    print('validate valid   {:>10.0f} payloads/s'.format(
+        per_second(lambda: validate_all(valid), COUNT)))
+    print('validate invalid {:>10.0f} payloads/s'.format(
+        per_second(lambda: validate_all(invalid), COUNT)))
+
+
+if __name__ == '__main__':
+    main()
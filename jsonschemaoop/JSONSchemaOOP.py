@@ -1,7 +1,8 @@
 # coding: utf-8
 
 from copy import deepcopy
-from jsonschema import Draft4Validator
+
+from jsonschemaoop import metrics
 
 
 class JSONType(object):
@@ -136,7 +137,9 @@ class JSONArray(JSONType):
     def render(self):
         obj = super(JSONArray, self).render()
 
-        if self._items:
+        if isinstance(self._items, JSONType):
+            obj.update(items=self._items.render())
+        elif self._items:
             obj.update(items=[i.render() for i in self._items])
         if self._unique_items:
             obj.update(uniqueItems=self._unique_items)
@@ -265,4 +268,14 @@ class JSONSchema(JSONObject):
         return schema
 
     def validate(self, data):
-        Draft4Validator(self.render()).validate(data)
+        # jsonschema is slow to import, load it only if a schema is validated.
+        # This is done before metrics start timing, it is no part of the latency
+        from jsonschemaoop.validators import JSONSchemaValidator
+
+        registry = metrics.registry
+        if registry is not None:
+            registry.observe(
+                self, data, lambda data: JSONSchemaValidator(self.render()).validate(data)
+            )
+        else:
+            JSONSchemaValidator(self.render()).validate(data)
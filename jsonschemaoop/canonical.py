@@ -0,0 +1,23 @@
+# coding: utf-8
+
+_SCALAR = 0
+_BOOLEAN = 1
+_ARRAY = 2
+_OBJECT = 3
+
+
+def canonical(item):
+    """
+    Return a hashable form of `item` which compares by JSON rules.
+
+    `true` and `1` are different, `1` and `1.0` are the same.
+    Objects compare by their members regardless of key order.
+
+    """
+    if item is True or item is False:
+        return _BOOLEAN, item
+    if isinstance(item, dict):
+        return _OBJECT, frozenset((key, canonical(value)) for key, value in item.items())
+    if isinstance(item, (list, tuple)):
+        return _ARRAY, tuple(canonical(value) for value in item)
+    return _SCALAR, item
@@ -0,0 +1,684 @@
+# coding: utf-8
+
+import random
+import string
+from copy import deepcopy
+from math import ceil, floor, inf, nextafter
+
+from jsonschemaoop.JSONSchemaOOP import JSONArray, JSONBoolean, JSONEnum, JSONNull, JSONNumber, \
+    JSONObject, JSONOneOf, JSONSchema, JSONSchemaReference, JSONString
+from jsonschemaoop.canonical import canonical
+
+ALPHABET = string.ascii_letters + string.digits
+
+# Range of generated numbers and lengths if the schema does not limit them
+NUMBER_RANGE = 1000
+STRING_LENGTH = 16
+ARRAY_LENGTH = 5
+
+# References followed before arrays get their minimum length and optional properties are left out
+MAX_DEPTH = 10
+
+# Attempts to find a float multiple or a unique array item before giving up
+MAX_ATTEMPTS = 100
+
+# Returned when no unique value was found
+_MISSING = object()
+
+# Number of distinct values `_value_of` generates for a type, others have many
+_TYPE_SIZES = {'boolean': 2, 'null': 1, 'array': 1, 'object': 1}
+
+# Values of a wrong type, the first one which is not allowed is used
+_WRONG_TYPES = (
+    ('string', 'wrong-type'),
+    ('number', 0.5),
+    ('boolean', True),
+    ('null', None),
+    ('array', []),
+    ('object', {}),
+)
+
+
+def _is_multiple(value, multiple_of):
+    # Same rule as the multipleOf validator of jsonschema
+    if isinstance(multiple_of, float):
+        quotient = value / multiple_of
+        return int(quotient) == quotient
+    return not value % multiple_of
+
+
+def _type_violations(types):
+    if isinstance(types, str):
+        types = [types]
+    for name, value in _WRONG_TYPES:
+        if name not in types:
+            return [('type', lambda: deepcopy(value))]
+    return []
+
+
+def _check_additional(json_type, name, value):
+    # Additional values are generated as strings, which only a boolean or empty schema allows
+    if value is not None and value is not True and value is not False and value != {}:
+        raise ValueError('{} {} schema {!r} can not be generated'.format(
+            type(json_type).__name__, name, value))
+
+
+def _prefixed(prefix, violations):
+    return [('{}/{}'.format(prefix, path), make) for path, make in violations]
+
+
+class _Node(object):
+    """
+    A compiled schema type. `generate()` returns a valid value,
+    `violations()` returns `(schema path, make invalid value)` pairs.
+    `size` is the number of distinct values, None if there are many.
+
+    """
+
+    def __init__(self, generate, violations=None, size=None):
+        self.generate = generate
+        self.violations = violations or list
+        self.size = size
+
+
+class PayloadGenerator(object):
+    """
+    Generate valid and invalid payloads for a `JSONSchema` or any `JSONType`.
+
+    > generator = PayloadGenerator(AddressSchema(), seed=42)
+    > generator.generate()
+    > generator.generate_many(10000)
+    > generator.generate_invalid()
+    > ('properties/address/required/zip', {'address': {...}})
+
+    References are followed up to `max_depth` levels with random payloads,
+    deeper levels get the minimum of array items and properties.
+
+    Every invalid payload violates exactly one constraint. `JSONOneOf` has
+    no invalid variants and one of its types is picked at random, so the
+    types should not overlap. Formats are generated but never violated,
+    `Draft4Validator` does not check them by default. Patterns and schemas
+    for additional properties or items can not be generated and raise a
+    ValueError.
+
+    """
+
+    def __init__(self, schema, seed=None, definitions=None, max_depth=MAX_DEPTH):
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self._depth = 0
+
+        if definitions is None:
+            definitions = schema.get_definitions() if isinstance(schema, JSONSchema) else {}
+        self._definition_types = definitions
+        self._definitions = {}
+        self._resolving = set()
+
+        self._root = self._compile(schema)
+        self._violations = None
+
+    def generate(self):
+        return self._root.generate()
+
+    def generate_many(self, count):
+        generate = self._root.generate
+        return [generate() for _ in range(count)]
+
+    def violations(self):
+        """
+        Return the schema paths of all constraints which can be violated
+        """
+        return [path for path, _ in self._get_violations()]
+
+    def generate_invalid(self, path=None):
+        """
+        Return `(path, payload)` where the payload violates the constraint
+        at `path`, or a random constraint if no path is given.
+
+        """
+        violations = self._get_violations()
+        if not violations:
+            raise ValueError('Schema has no constraints to violate')
+
+        if path is None:
+            path, make = self.random.choice(violations)
+        else:
+            make = dict(violations).get(path)
+            if make is None:
+                raise ValueError('Schema has no constraint {!r} to violate'.format(path))
+        return path, make()
+
+    def invalid_variants(self):
+        """
+        Yield `(path, payload)` once for every constraint
+        """
+        for path, make in self._get_violations():
+            yield path, make()
+
+    def _get_violations(self):
+        if self._violations is None:
+            self._violations = self._root.violations()
+        return self._violations
+
+    def _compile(self, json_type):
+        if isinstance(json_type, JSONSchemaReference):
+            return self._reference(json_type)
+        if isinstance(json_type, JSONOneOf):
+            return self._one_of(json_type)
+        if isinstance(json_type, JSONEnum):
+            return self._enum(json_type)
+        if isinstance(json_type, JSONNumber):
+            return self._number(json_type)
+        if isinstance(json_type, JSONString):
+            return self._string(json_type)
+        if isinstance(json_type, JSONBoolean):
+            return self._any_of(['boolean'])
+        if isinstance(json_type, JSONNull):
+            return self._any_of(['null'])
+        if isinstance(json_type, JSONArray):
+            return self._array(json_type)
+        if isinstance(json_type, JSONObject):
+            return self._object(json_type)
+        return self._any_of(json_type.type)
+
+    def _definition(self, name):
+        node = self._definitions.get(name)
+        if node is None:
+            if name not in self._definition_types:
+                raise ValueError('Unknown definition {!r}'.format(name))
+            node = self._definitions[name] = self._compile(self._definition_types[name])
+        return node
+
+    def _reference(self, json_type):
+        name = json_type.type
+
+        def violations():
+            # Recursive definitions are violated at their first level only
+            if name in self._resolving:
+                return []
+            self._resolving.add(name)
+            try:
+                return self._definition(name).violations()
+            finally:
+                self._resolving.discard(name)
+
+        def generate():
+            self._depth += 1
+            try:
+                # Past max_depth only minimal payloads are generated, these must end soon
+                if self._depth > 2 * self.max_depth:
+                    raise ValueError('Definition {!r} has no payload within {} levels'.format(
+                        name, 2 * self.max_depth))
+                return self._definition(name).generate()
+            finally:
+                self._depth -= 1
+
+        return _Node(generate, violations)
+
+    def _one_of(self, json_type):
+        nodes = [self._compile(t) for t in json_type._type]
+        choice = self.random.choice
+        return _Node(lambda: choice(nodes).generate())
+
+    def _enum(self, json_type):
+        values = list(json_type.values)
+        choice = self.random.choice
+
+        def not_in_enum():
+            index = len(values)
+            while 'value-{}'.format(index) in values:
+                index += 1
+            return 'value-{}'.format(index)
+
+        # A value of the wrong type is not in the enum either, so only enum is violated
+        return _Node(lambda: choice(values), lambda: [('enum', not_in_enum)],
+                     size=len(set(canonical(value) for value in values)))
+
+    def _any_of(self, types):
+        if types is None:
+            return _Node(lambda: self._value_of('string'))
+
+        if isinstance(types, str):
+            types = [types]
+        choice = self.random.choice
+
+        size = None
+        if all(name in _TYPE_SIZES for name in types):
+            size = sum(_TYPE_SIZES[name] for name in set(types))
+
+        return _Node(lambda: self._value_of(choice(types)), lambda: _type_violations(types), size)
+
+    def _value_of(self, name):
+        rng = self.random
+        if name == 'string':
+            return ''.join(rng.choices(ALPHABET, k=rng.randint(0, STRING_LENGTH)))
+        if name == 'number':
+            return rng.uniform(-NUMBER_RANGE, NUMBER_RANGE)
+        if name == 'integer':
+            return rng.randint(-NUMBER_RANGE, NUMBER_RANGE)
+        if name == 'boolean':
+            return rng.random() < 0.5
+        if name == 'array':
+            return []
+        if name == 'object':
+            return {}
+        return None
+
+    def _number(self, json_type):
+        rng = self.random
+        minimum = json_type.minimum or None
+        maximum = json_type.maximum or None
+        multiple_of = json_type.multiple_of or None
+
+        low = minimum if minimum is not None else (
+            maximum - NUMBER_RANGE if maximum is not None else -NUMBER_RANGE)
+        high = maximum if maximum is not None else low + 2 * NUMBER_RANGE
+        if low > high:
+            raise ValueError('JSONNumber minimum {} is above maximum {}'.format(low, high))
+
+        def multiple(factors):
+            for factor in factors:
+                value = factor * multiple_of
+                if _is_multiple(value, multiple_of):
+                    return value
+            raise ValueError('No multiple of {} found'.format(multiple_of))
+
+        size = None
+        if multiple_of is None:
+            int_low, int_high = int(ceil(low)), int(floor(high))
+
+            def generate():
+                if int_low <= int_high and rng.random() < 0.5:
+                    return rng.randint(int_low, int_high)
+                return rng.uniform(low, high)
+        else:
+            factor_low = int(ceil(low / float(multiple_of)))
+            factor_high = int(floor(high / float(multiple_of)))
+            if factor_low > factor_high:
+                raise ValueError('No multiple of {} between {} and {}'.format(
+                    multiple_of, low, high))
+            size = factor_high - factor_low + 1
+
+            randint = rng.randint
+
+            def generate():
+                value = randint(factor_low, factor_high) * multiple_of
+                if _is_multiple(value, multiple_of):
+                    return value
+                return multiple(randint(factor_low, factor_high) for _ in range(MAX_ATTEMPTS))
+
+        def violations():
+            found = _type_violations('number')
+
+            if multiple_of is None:
+                # Large floats do not change by 1, take the next float instead
+                if minimum is not None:
+                    below = minimum - 1
+                    if not below < minimum:
+                        below = nextafter(minimum, -inf)
+                    found.append(('minimum', lambda: below))
+                if maximum is not None:
+                    above = maximum + 1
+                    if not above > maximum:
+                        above = nextafter(maximum, inf)
+                    found.append(('maximum', lambda: above))
+                return found
+
+            if minimum is not None:
+                below = range(factor_low - 1, factor_low - 1 - MAX_ATTEMPTS, -1)
+                found.append(('minimum', lambda: multiple(below)))
+            if maximum is not None:
+                above = range(factor_high + 1, factor_high + 1 + MAX_ATTEMPTS)
+                found.append(('maximum', lambda: multiple(above)))
+
+            between = [
+                factor * multiple_of + multiple_of / 2.0
+                for factor in range(factor_low, min(factor_high, factor_low + MAX_ATTEMPTS) + 1)
+            ]
+            between = [
+                value for value in between
+                if low <= value <= high and not _is_multiple(value, multiple_of)
+            ]
+            if between:
+                found.append(('multipleOf', lambda: rng.choice(between)))
+            return found
+
+        return _Node(generate, violations, size)
+
+    def _string(self, json_type):
+        if json_type.pattern:
+            raise ValueError('JSONString pattern {!r} can not be generated'.format(
+                json_type.pattern))
+
+        rng = self.random
+        min_length = json_type.min_length or 0
+        max_length = json_type.max_length or min_length + STRING_LENGTH
+        if min_length > max_length:
+            raise ValueError('JSONString min_length {} is above max_length {}'.format(
+                min_length, max_length))
+
+        def text(length):
+            return ''.join(rng.choices(ALPHABET, k=length))
+
+        size = None
+        generate = self._format(json_type.format, min_length, json_type.max_length or None)
+        if generate is None:
+            def generate():
+                return text(rng.randint(min_length, max_length))
+
+            # Longer strings have more distinct values than any array needs
+            if max_length <= STRING_LENGTH:
+                size = sum(len(ALPHABET) ** length for length in range(min_length, max_length + 1))
+
+        def violations():
+            found = _type_violations('string')
+            if min_length:
+                found.append(('minLength', lambda: text(min_length - 1)))
+            if json_type.max_length:
+                found.append(('maxLength', lambda: text(max_length + 1)))
+            return found
+
+        return _Node(generate, violations, size)
+
+    def _format(self, format, min_length, max_length):
+        """
+        Return a generator of `format` strings between `min_length` and
+        `max_length` (None for no limit) characters, or None for unknown formats.
+
+        Every format is a template with a number of parts, the length is
+        picked first and then split up between the parts.
+
+        """
+        rng = self.random
+        randint = rng.randint
+
+        def name(length):
+            return ''.join(rng.choices(string.ascii_lowercase, k=length))
+
+        def decimal(length):
+            return str(randint(10 ** (length - 1) if length > 1 else 0, min(255, 10 ** length - 1)))
+
+        def hexadecimal(length):
+            return '{:x}'.format(randint(16 ** (length - 1) if length > 1 else 0, 16 ** length - 1))
+
+        def date_time(length):
+            return '{:04}-{:02}-{:02}T{:02}:{:02}:{:02}Z'.format(
+                randint(1970, 2100), randint(1, 12), randint(1, 28),
+                randint(0, 23), randint(0, 59), randint(0, 59))
+
+        # template, parts, shortest part, longest part, make part of a length
+        formats = {
+            JSONString.FORMAT_DATETIME: ('{}', 1, 20, 20, date_time),
+            JSONString.FORMAT_EMAIL: ('{}@{}.com', 2, 1, 10, name),
+            JSONString.FORMAT_URI: ('https://{}.com/{}', 2, 1, 10, name),
+            JSONString.FORMAT_HOST_NAME: ('{}.{}.com', 2, 1, 10, name),
+            JSONString.FORMAT_IPV4: ('{}.{}.{}.{}', 4, 1, 3, decimal),
+            JSONString.FORMAT_IPV6: (':'.join(['{}'] * 8), 8, 1, 4, hexadecimal),
+        }
+        if format not in formats:
+            return None
+
+        template, parts, shortest, longest, part = formats[format]
+        overhead = len(template.format(*[''] * parts))
+        low = max(min_length, overhead + parts * shortest)
+        high = overhead + parts * longest
+        if max_length is not None:
+            high = min(high, max_length)
+        if low > high:
+            raise ValueError('JSONString format {!r} can not have {} to {} characters'.format(
+                format, min_length, max_length))
+
+        def generate():
+            remaining = randint(low, high) - overhead
+            values = []
+            for index in range(parts):
+                rest = parts - index - 1
+                length = randint(max(shortest, remaining - rest * longest),
+                                 min(longest, remaining - rest * shortest))
+                remaining -= length
+                values.append(part(length))
+            return template.format(*values)
+
+        return generate
+
+    def _array(self, json_type):
+        rng = self.random
+        items = json_type._items
+        unique = bool(json_type._unique_items)
+        min_items = json_type._min_items or 0
+        max_items = json_type._max_items or None
+
+        if isinstance(items, (list, tuple)):
+            _check_additional(json_type, 'additional_items', json_type._additional_items)
+            nodes = [self._compile(t) for t in items]
+            if min_items > len(nodes):
+                if json_type._additional_items is False:
+                    raise ValueError('JSONArray needs {} items but has {} types'.format(
+                        min_items, len(nodes)))
+                nodes += [self._any_of('string')] * (min_items - len(nodes))
+            if max_items is not None:
+                nodes = nodes[:max_items]
+            item = None
+        else:
+            nodes = None
+            item = self._compile(items)
+
+        lowest = min_items
+        highest = max_items if max_items is not None else min_items + ARRAY_LENGTH
+        if lowest > highest:
+            raise ValueError('JSONArray min_items {} is above max_items {}'.format(
+                min_items, max_items))
+
+        # Items of types with few values can only make short unique arrays
+        size = item.size if unique and item is not None else None
+        if size is not None:
+            if size < lowest:
+                raise ValueError('Can not generate {} unique items'.format(lowest))
+            highest = min(highest, size)
+
+        def unique_value(node, seen):
+            for _ in range(MAX_ATTEMPTS):
+                value = node.generate()
+                key = canonical(value)
+                if key not in seen:
+                    seen.add(key)
+                    return value
+            return _MISSING
+
+        def fill(count, minimum=None):
+            """
+            Return `count` items, unique ones may stop at `minimum` items
+            """
+            if not unique:
+                return [item.generate() for _ in range(count)]
+
+            values, seen = [], set()
+            while len(values) < count:
+                value = unique_value(item, seen)
+                if value is _MISSING:
+                    if minimum is not None and len(values) >= minimum:
+                        break
+                    raise ValueError('Can not generate {} unique items'.format(count))
+                values.append(value)
+            return values
+
+        if nodes is not None:
+            def generate():
+                if not unique:
+                    return [node.generate() for node in nodes]
+
+                values, seen = [], set()
+                for node in nodes:
+                    value = unique_value(node, seen)
+                    if value is _MISSING:
+                        raise ValueError('Can not generate {} unique items'.format(len(nodes)))
+                    values.append(value)
+                return values
+        else:
+            def generate():
+                if self._depth > self.max_depth:
+                    return fill(lowest)
+                return fill(rng.randint(lowest, highest), lowest)
+
+        def replaced(count, index, make):
+            def make_array():
+                values = generate() if nodes is not None else fill(count)
+                values[index(len(values))] = make()
+                return values
+            return make_array
+
+        def violations():
+            found = _type_violations('array')
+
+            if nodes is not None:
+                # Padded items are not in the schema, so they can not be violated
+                for index, node in enumerate(nodes[:len(items)]):
+                    found += [
+                        ('items/{}/{}'.format(index, path),
+                         replaced(None, lambda length, index=index: index, make))
+                        for path, make in node.violations()
+                    ]
+                if min_items:
+                    found.append(('minItems', lambda: generate()[:min_items - 1]))
+                if max_items is not None and len(items) <= max_items and \
+                        json_type._additional_items is not False:
+                    def too_many():
+                        values = generate()
+                        return values + [self._value_of('string')
+                                         for _ in range(max_items + 1 - len(values))]
+                    found.append(('maxItems', too_many))
+                return found
+
+            if min_items:
+                found.append(('minItems', lambda: fill(min_items - 1)))
+            if max_items is not None and (size is None or size > max_items):
+                def too_many():
+                    return fill(max_items + 1)
+
+                # Unique items may run out before there are too many, leave the constraint out then
+                try:
+                    too_many()
+                except ValueError:
+                    pass
+                else:
+                    found.append(('maxItems', too_many))
+            if unique and highest >= 2:
+                def duplicated():
+                    values = fill(max(lowest, 2))
+                    values[-1] = values[0]
+                    return values
+                found.append(('uniqueItems', duplicated))
+
+            count = max(lowest, 1)
+            if count <= highest:
+                found += [
+                    ('items/{}'.format(path),
+                     replaced(count, lambda length: rng.randrange(length), make))
+                    for path, make in item.violations()
+                ]
+            return found
+
+        return _Node(generate, violations)
+
+    def _object(self, json_type):
+        rng = self.random
+        properties = json_type.get_properties()
+        required = sorted(json_type.get_required())
+        optional = [key for key in properties if key not in json_type.get_required()]
+        min_properties = json_type._min_properties or 0
+        max_properties = json_type._max_properties or None
+        _check_additional(json_type, 'additional_properties', json_type._additional_properties)
+        additional = json_type._additional_properties is not False
+
+        nodes = {key: self._compile(value) for key, value in properties.items()}
+        # Required keys without a property can have any value, strings are generated
+        for key in required:
+            if key not in nodes:
+                nodes[key] = self._any_of(None)
+
+        if max_properties is not None and len(required) > max_properties:
+            raise ValueError('JSONObject requires {} properties but allows {}'.format(
+                len(required), max_properties))
+        if not additional and len(nodes) < min_properties:
+            raise ValueError('JSONObject needs {} properties but has {}'.format(
+                min_properties, len(nodes)))
+
+        def build(size=None, include=None, exclude=None):
+            data = {key: nodes[key].generate() for key in required if key != exclude}
+
+            if size is None and self._depth > self.max_depth:
+                keys = []
+            else:
+                keys = [
+                    key for key in optional
+                    if key != include and key != exclude and (size is not None or rng.random() < 0.5)
+                ]
+            if include is not None and include not in data:
+                keys.insert(0, include)
+
+            limit = size if size is not None else max_properties
+            for key in keys:
+                if limit is not None and len(data) >= limit:
+                    break
+                data[key] = nodes[key].generate()
+
+            # Top up with the remaining optional properties, then with additional ones
+            target = size if size is not None else min_properties
+            for key in optional:
+                if len(data) >= target:
+                    break
+                if key != exclude and key not in data:
+                    data[key] = nodes[key].generate()
+
+            extra = 0
+            while additional and len(data) < target:
+                key = 'property_{}'.format(extra)
+                extra += 1
+                if key not in nodes:
+                    data[key] = self._value_of('string')
+            return data
+
+        def generate():
+            return build()
+
+        def without(key):
+            return lambda: build(exclude=key)
+
+        def replaced(key, make):
+            def make_object():
+                data = build(include=key)
+                data[key] = make()
+                return data
+            return make_object
+
+        def violations():
+            found = _type_violations('object')
+            if additional or len(nodes) > min_properties:
+                found += [('required/{}'.format(key), without(key)) for key in required]
+
+            if min_properties and len(required) < min_properties:
+                found.append(('minProperties', lambda: build(size=min_properties - 1)))
+            if max_properties is not None and (additional or len(nodes) > max_properties):
+                found.append(('maxProperties', lambda: build(size=max_properties + 1)))
+            room = max_properties is None or (
+                len(required) < max_properties and min_properties < max_properties)
+            if not additional and room and 'unexpected_property' not in nodes:
+                def unexpected():
+                    data = build()
+                    if max_properties is not None and len(data) >= max_properties:
+                        data.pop(next(key for key in reversed(optional) if key in data))
+                    data['unexpected_property'] = self._value_of('string')
+                    return data
+                found.append(('additionalProperties', unexpected))
+
+            full = max_properties is not None and len(required) >= max_properties
+            for key, node in nodes.items():
+                if full and key in optional or key not in properties:
+                    continue
+                found += _prefixed(
+                    'properties/{}'.format(key),
+                    [(path, replaced(key, make)) for path, make in node.violations()]
+                )
+            return found
+
+        return _Node(generate, violations)
@@ -0,0 +1,196 @@
+# coding: utf-8
+
+from time import perf_counter_ns
+
+# Latency bucket `i` counts validations which took less than 2 ** i nanoseconds
+LATENCY_BUCKETS = 40
+
+# Active registry, `JSONSchema.validate` reports nothing while this is None
+registry = None
+
+
+def enable(metrics_registry=None):
+    """
+    Report every `JSONSchema.validate` call to `metrics_registry`,
+    a new `MetricsRegistry` is created if none is given.
+
+    """
+    global registry
+    registry = metrics_registry if metrics_registry is not None else MetricsRegistry()
+    return registry
+
+
+def disable():
+    global registry
+    registry = None
+
+
+def snapshot():
+    return registry.snapshot() if registry is not None else {}
+
+
+def _schema_name(schema):
+    cls = type(schema)
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+def _percentile(buckets, count, quantile):
+    threshold = count * quantile
+    seen = 0
+    for index, bucket_count in enumerate(buckets):
+        seen += bucket_count
+        if seen >= threshold:
+            return 2 ** index
+    return None
+
+
+def _new_counters():
+    return [0, 0, 0, [0] * LATENCY_BUCKETS]
+
+
+def _merge(totals, stats):
+    for name, (count, failures, payload_bytes, buckets) in stats.items():
+        total = totals.get(name)
+        if total is None:
+            total = totals[name] = _new_counters()
+        total[0] += count
+        total[1] += failures
+        total[2] += payload_bytes
+        total[3] = [a + b for a, b in zip(total[3], buckets)]
+
+
+def _thread_ended(registry_ref, key):
+    registry = registry_ref()
+    if registry is not None:
+        with registry._lock:
+            _merge(registry._ended_stats, registry._thread_stats.pop(key))
+
+
+class _ThreadStats(object):
+    """
+    Holds the counters of one thread. It is only referenced by the thread
+    local, so it is collected when the thread ends.
+
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+
+class MetricsRegistry(object):
+    """
+    Counts validations, failures and a log2 bucketed latency histogram
+    per schema class. Payload bytes are only counted with `payload_size`,
+    every payload is serialized to JSON for that.
+
+    Each thread writes to its own counters without locking, the counters
+    of all threads are summed up by `snapshot`. Counters of ended threads
+    are folded into a shared total.
+
+    """
+
+    def __init__(self, payload_size=False):
+        # Imported here, disabled metrics cost nothing on the package import
+        import threading
+
+        self.payload_size = payload_size
+        self._local = threading.local()
+        # Reentrant, the finalizer of an ended thread may run while the lock is held
+        self._lock = threading.RLock()
+        self._thread_stats = {}
+        self._ended_stats = {}
+
+    def _stats(self):
+        try:
+            return self._local.holder.stats
+        except AttributeError:
+            import weakref
+
+            holder = self._local.holder = _ThreadStats()
+            key = id(holder)
+            with self._lock:
+                self._thread_stats[key] = holder.stats
+            weakref.finalize(holder, _thread_ended, weakref.ref(self), key)
+            return holder.stats
+
+    def observe(self, schema, data, validate):
+        """
+        Call `validate(data)` and record it for the class of `schema`.
+        Exceptions are counted as failure and raised again.
+
+        """
+        start = perf_counter_ns()
+        try:
+            validate(data)
+        except Exception:
+            self.record(schema, data, perf_counter_ns() - start, failed=True)
+            raise
+        self.record(schema, data, perf_counter_ns() - start, failed=False)
+
+    def record(self, schema, data, nanoseconds, failed):
+        stats = self._stats()
+        name = _schema_name(schema)
+
+        counters = stats.get(name)
+        if counters is None:
+            counters = stats[name] = _new_counters()
+
+        counters[0] += 1
+        if failed:
+            counters[1] += 1
+        if self.payload_size:
+            # json imports re, keep it out of the package import
+            import json
+
+            counters[2] += len(json.dumps(data, separators=(',', ':'), default=str))
+
+        counters[3][min(nanoseconds.bit_length(), LATENCY_BUCKETS - 1)] += 1
+
+    def reset(self):
+        with self._lock:
+            self._ended_stats.clear()
+            for stats in self._thread_stats.values():
+                stats.clear()
+
+    def snapshot(self):
+        """
+        Return the summed up counters of all threads
+
+        > {
+        >     'myapp.schemas.AddressSchema': {
+        >         'count': 120,
+        >         'failures': 3,
+        >         'payload_bytes': 48000,
+        >         'latency_ns': {
+        >             'buckets': {65536: 20, 131072: 100},
+        >             'p50': 131072,
+        >             'p99': 131072,
+        >         },
+        >     },
+        > }
+
+        Latencies are the upper bounds of their histogram bucket in nanoseconds.
+
+        """
+        totals = {}
+        with self._lock:
+            _merge(totals, self._ended_stats)
+            for stats in list(self._thread_stats.values()):
+                _merge(totals, dict(stats))
+
+        return {
+            name: {
+                'count': count,
+                'failures': failures,
+                'payload_bytes': payload_bytes,
+                'latency_ns': {
+                    'buckets': {
+                        2 ** index: bucket_count
+                        for index, bucket_count in enumerate(buckets) if bucket_count
+                    },
+                    'p50': _percentile(buckets, count, 0.5),
+                    'p99': _percentile(buckets, count, 0.99),
+                },
+            }
+            for name, (count, failures, payload_bytes, buckets) in totals.items()
+        }
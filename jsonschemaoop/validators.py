@@ -0,0 +1,141 @@
+# coding: utf-8
+
+from math import isnan
+
+from jsonschema import Draft4Validator
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import extend
+
+from jsonschemaoop.canonical import canonical
+
+_SCALAR_TYPES = frozenset([str, int, float])
+_NUMBER_TYPES = frozenset([int, float])
+_NUMBER_KEYWORDS = frozenset(['type', 'minimum', 'maximum', 'multipleOf'])
+_STRING_TYPES = frozenset([str])
+_STRING_KEYWORDS = frozenset(['type', 'minLength', 'maxLength'])
+
+_draft4_items = Draft4Validator.VALIDATORS['items']
+
+
+def find_duplicate(items):
+    """
+    Return the indexes `(first, second)` of the first duplicate in `items`
+    or None if all items are unique.
+
+    Strings and numbers are hashed as they are, other items in their
+    canonical form, so this is linear for all JSON values. Items which can
+    not be hashed are compared pairwise.
+
+    """
+    types = set(map(type, items))
+    if types <= _SCALAR_TYPES and len(set(items)) == len(items):
+        return None
+
+    seen = {}
+    unhashable = []
+    scalars = types <= _SCALAR_TYPES
+
+    for index, item in enumerate(items):
+        # Strings and numbers hash by JSON rules already and never equal a canonical tuple
+        try:
+            key = item if scalars or type(item) in _SCALAR_TYPES else canonical(item)
+            first = seen.setdefault(key, index)
+        except TypeError:
+            for first, other in unhashable:
+                if other == item:
+                    return first, index
+            unhashable.append((index, item))
+            continue
+
+        if first != index:
+            return first, index
+
+    return None
+
+
+def unique_items(validator, uI, instance, schema):
+    if not uI or not validator.is_type(instance, "array"):
+        return
+
+    duplicate = find_duplicate(instance)
+    if duplicate is not None:
+        yield ValidationError(
+            "%r has non-unique elements (items %d and %d are equal)" % ((instance,) + duplicate)
+        )
+
+
+def _is_multiple(instance, dB):
+    if isinstance(dB, float):
+        return all(int(quotient) == quotient for quotient in (value / dB for value in instance))
+    return not any(value % dB for value in instance)
+
+
+def _numbers_valid(instance, schema):
+    types = set(map(type, instance))
+    if not types <= _NUMBER_TYPES:
+        return False
+    # min() and max() are not reliable with NaN, leave those to the per-item path
+    if float in types and isnan(sum(instance)):
+        return False
+    if 'minimum' in schema and min(instance) < schema['minimum']:
+        return False
+    if 'maximum' in schema and max(instance) > schema['maximum']:
+        return False
+    if 'multipleOf' in schema and not _is_multiple(instance, schema['multipleOf']):
+        return False
+    return True
+
+
+def _strings_valid(instance, schema):
+    if not set(map(type, instance)) <= _STRING_TYPES:
+        return False
+    lengths = list(map(len, instance))
+    if 'minLength' in schema and min(lengths) < schema['minLength']:
+        return False
+    if 'maxLength' in schema and max(lengths) > schema['maxLength']:
+        return False
+    return True
+
+
+_HOMOGENEOUS_CHECKS = {
+    'number': (_NUMBER_KEYWORDS, _numbers_valid),
+    'string': (_STRING_KEYWORDS, _strings_valid),
+}
+
+
+def _homogeneous_valid(items, instance):
+    """
+    Check all of `instance` at once against a single `number` or `string`
+    item schema. Returns False if the array is invalid or the schema is
+    not supported, the caller must then check item by item.
+
+    """
+    if not isinstance(items, dict) or not isinstance(items.get('type'), str):
+        return False
+
+    check = _HOMOGENEOUS_CHECKS.get(items['type'])
+    if check is None:
+        return False
+
+    keywords, valid = check
+    if not keywords.issuperset(items):
+        return False
+
+    try:
+        return not instance or valid(instance, items)
+    except (ArithmeticError, TypeError, ValueError):
+        return False
+
+
+def items(validator, items, instance, schema):
+    if validator.is_type(instance, "array") and _homogeneous_valid(items, instance):
+        return
+
+    for error in _draft4_items(validator, items, instance, schema):
+        yield error
+
+
+JSONSchemaValidator = extend(Draft4Validator, {
+    'items': items,
+    'uniqueItems': unique_items,
+})
@@ -0,0 +1,245 @@
+# coding: utf-8
+
+import pytest
+from jsonschema import Draft4Validator
+
+from jsonschemaoop import JSONSchemaOOP
+from jsonschemaoop.generator import PayloadGenerator
+from tests.test_json_types import AddressJSONSchemaObjectV3
+
+
+class AddressSchema(JSONSchemaOOP.JSONSchema):
+    required = ['address', 'tags']
+    properties = {
+        'address': JSONSchemaOOP.JSONSchemaReference('address'),
+        'tags': JSONSchemaOOP.JSONArray(
+            items=JSONSchemaOOP.JSONString(min_length=2, max_length=8),
+            unique_items=True, min_items=1, max_items=4
+        ),
+        'kind': JSONSchemaOOP.JSONEnum(['home', 'work']),
+        'rating': JSONSchemaOOP.JSONNumber(minimum=1, maximum=5, multiple_of=0.5),
+        'visits': JSONSchemaOOP.JSONNumber(minimum=10, maximum=1000, multiple_of=10),
+        'email': JSONSchemaOOP.JSONString(format=JSONSchemaOOP.JSONString.FORMAT_EMAIL),
+        'verified': JSONSchemaOOP.JSONBoolean(),
+        'deleted': JSONSchemaOOP.JSONNull(),
+        'point': JSONSchemaOOP.JSONArray(
+            items=[JSONSchemaOOP.JSONNumber(maximum=90), JSONSchemaOOP.JSONNumber(maximum=180)],
+            min_items=2
+        ),
+        'contact': JSONSchemaOOP.JSONObject(
+            required=['name'],
+            properties={
+                'name': JSONSchemaOOP.JSONString(min_length=1),
+                'phone': JSONSchemaOOP.JSONType(JSONSchemaOOP.JSONNumber(),
+                                                JSONSchemaOOP.JSONString()),
+            },
+            min_properties=1,
+            max_properties=1,
+            additional_properties=False,
+        ),
+    }
+    definitions = {
+        'address': AddressJSONSchemaObjectV3()
+    }
+
+
+class TestPayloadGenerator(object):
+    def test_generates_valid_payloads(self):
+        schema = AddressSchema()
+        validator = Draft4Validator(schema.render())
+
+        for data in PayloadGenerator(schema, seed=1).generate_many(500):
+            validator.validate(data)
+
+    def test_invalid_variants_violate_one_constraint(self):
+        schema = AddressSchema()
+        validator = Draft4Validator(schema.render())
+        generator = PayloadGenerator(schema, seed=1)
+
+        paths = []
+        for _ in range(20):
+            for path, data in generator.invalid_variants():
+                errors = list(validator.iter_errors(data))
+                assert len(errors) == 1, (path, data, errors)
+                paths.append(path)
+
+        assert set(paths) == set(generator.violations())
+        assert 'required/address' in paths
+        assert 'properties/tags/uniqueItems' in paths
+        assert 'properties/tags/items/maxLength' in paths
+        assert 'properties/rating/multipleOf' in paths
+        assert 'properties/contact/additionalProperties' not in paths
+        assert 'properties/address/additionalProperties' not in paths
+        assert 'properties/contact/maxProperties' in paths
+        assert 'properties/point/items/1/maximum' in paths
+        assert 'properties/address/required/staff' in paths
+
+    def test_required_without_property(self):
+        class MySchema(JSONSchemaOOP.JSONSchema):
+            required = ['id', 'name']
+            properties = {
+                'name': JSONSchemaOOP.JSONString(min_length=1)
+            }
+
+        schema = MySchema()
+        validator = Draft4Validator(schema.render())
+        generator = PayloadGenerator(schema, seed=0)
+
+        for data in generator.generate_many(100):
+            validator.validate(data)
+        for path, data in generator.invalid_variants():
+            assert len(list(validator.iter_errors(data))) == 1, path
+        assert not any(path.startswith('properties/id/') for path in generator.violations())
+        assert 'required/id' in generator.violations()
+
+    def test_generate_invalid(self):
+        schema = AddressSchema()
+        validator = Draft4Validator(schema.render())
+        generator = PayloadGenerator(schema, seed=1)
+
+        path, data = generator.generate_invalid('properties/kind/enum')
+        assert path == 'properties/kind/enum'
+        assert data['kind'] not in ('home', 'work')
+
+        for _ in range(100):
+            path, data = generator.generate_invalid()
+            assert not validator.is_valid(data), path
+
+    def test_generate_invalid_unknown_path(self):
+        generator = PayloadGenerator(AddressSchema(), seed=1)
+
+        with pytest.raises(ValueError) as excinfo:
+            generator.generate_invalid('properties/missing/type')
+
+        assert 'properties/missing/type' in str(excinfo.value)
+
+    def test_reproducible(self):
+        first = PayloadGenerator(AddressSchema(), seed=42)
+        second = PayloadGenerator(AddressSchema(), seed=42)
+
+        assert first.generate_many(50) == second.generate_many(50)
+        assert list(first.invalid_variants()) == list(second.invalid_variants())
+
+    def test_recursive_definition(self):
+        class TreeSchema(JSONSchemaOOP.JSONSchema):
+            required = ['root']
+            properties = {
+                'root': JSONSchemaOOP.JSONSchemaReference('node')
+            }
+            definitions = {
+                'node': JSONSchemaOOP.JSONObject(
+                    required=['v'],
+                    properties={
+                        'v': JSONSchemaOOP.JSONNumber(),
+                        'children': JSONSchemaOOP.JSONArray(
+                            items=JSONSchemaOOP.JSONSchemaReference('node')
+                        ),
+                    }
+                )
+            }
+
+        def depth(node):
+            return 1 + max([depth(child) for child in node.get('children', [])] or [0])
+
+        schema = TreeSchema()
+        validator = Draft4Validator(schema.render())
+        generator = PayloadGenerator(schema, seed=0, max_depth=5)
+
+        for data in generator.generate_many(2000):
+            validator.validate(data)
+            assert depth(data['root']) <= 6
+        for path, data in generator.invalid_variants():
+            assert not validator.is_valid(data), path
+
+    def test_infinite_recursive_definition(self):
+        class LoopSchema(JSONSchemaOOP.JSONSchema):
+            required = ['next']
+            properties = {
+                'next': JSONSchemaOOP.JSONSchemaReference('loop')
+            }
+            definitions = {
+                'loop': JSONSchemaOOP.JSONObject(
+                    required=['next'],
+                    properties={'next': JSONSchemaOOP.JSONSchemaReference('loop')}
+                )
+            }
+
+        with pytest.raises(ValueError):
+            PayloadGenerator(LoopSchema()).generate()
+
+    @pytest.mark.parametrize(('json_type', 'check'), [
+        (JSONSchemaOOP.JSONNumber(minimum=3, maximum=4), lambda value: 3 <= value <= 4),
+        (JSONSchemaOOP.JSONNumber(multiple_of=7), lambda value: value % 7 == 0),
+        (JSONSchemaOOP.JSONString(min_length=3, max_length=3), lambda value: len(value) == 3),
+        (JSONSchemaOOP.JSONString(format=JSONSchemaOOP.JSONString.FORMAT_IPV4),
+         lambda value: len(value.split('.')) == 4),
+        (JSONSchemaOOP.JSONString(format=JSONSchemaOOP.JSONString.FORMAT_IPV4, max_length=7),
+         lambda value: value.count('.') == 3 and len(value) == 7),
+        (JSONSchemaOOP.JSONString(format=JSONSchemaOOP.JSONString.FORMAT_EMAIL, max_length=8),
+         lambda value: '@' in value and len(value) <= 8),
+        (JSONSchemaOOP.JSONString(format=JSONSchemaOOP.JSONString.FORMAT_URI, min_length=30),
+         lambda value: value.startswith('https://') and len(value) >= 30),
+        (JSONSchemaOOP.JSONString(format=JSONSchemaOOP.JSONString.FORMAT_IPV6, max_length=20),
+         lambda value: value.count(':') == 7 and len(value) <= 20),
+        (JSONSchemaOOP.JSONEnum(['a']), lambda value: value == 'a'),
+        (JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONNull(), min_items=2, max_items=2),
+         lambda value: value == [None, None]),
+    ])
+    def test_json_types(self, json_type, check):
+        generator = PayloadGenerator(json_type, seed=0)
+
+        for value in generator.generate_many(100):
+            assert check(value)
+
+    @pytest.mark.parametrize('json_type', [
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONEnum(['a', 'b']), unique_items=True),
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONBoolean(), unique_items=True),
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONNull(), unique_items=True, min_items=1),
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONNumber(minimum=1, maximum=3, multiple_of=1),
+                                unique_items=True, min_items=2),
+        JSONSchemaOOP.JSONArray(items=[JSONSchemaOOP.JSONBoolean(), JSONSchemaOOP.JSONBoolean()],
+                                unique_items=True),
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONString(max_length=1), unique_items=True,
+                                max_items=100),
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONNumber(minimum=1, maximum=3, multiple_of=1),
+                                unique_items=True, min_items=2, max_items=3),
+    ])
+    def test_unique_items(self, json_type):
+        validator = Draft4Validator(json_type.render())
+        generator = PayloadGenerator(json_type, seed=0)
+
+        for data in generator.generate_many(300):
+            validator.validate(data)
+        for path, data in generator.invalid_variants():
+            assert not validator.is_valid(data), path
+
+    @pytest.mark.parametrize('json_type', [
+        JSONSchemaOOP.JSONNumber(minimum=1e300),
+        JSONSchemaOOP.JSONNumber(maximum=-1e300),
+        JSONSchemaOOP.JSONNumber(minimum=-1e300, maximum=1e300),
+    ])
+    def test_large_number_bounds(self, json_type):
+        validator = Draft4Validator(json_type.render())
+        generator = PayloadGenerator(json_type, seed=0)
+
+        for data in generator.generate_many(100):
+            validator.validate(data)
+        for path, data in generator.invalid_variants():
+            assert not validator.is_valid(data), path
+
+    @pytest.mark.parametrize('json_type', [
+        JSONSchemaOOP.JSONString(pattern='^a'),
+        JSONSchemaOOP.JSONString(max_length=5, format=JSONSchemaOOP.JSONString.FORMAT_EMAIL),
+        JSONSchemaOOP.JSONString(min_length=21, format=JSONSchemaOOP.JSONString.FORMAT_DATETIME),
+        JSONSchemaOOP.JSONNumber(minimum=10, maximum=5),
+        JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONBoolean(), unique_items=True,
+                                min_items=3),
+        JSONSchemaOOP.JSONSchemaReference('missing'),
+        JSONSchemaOOP.JSONObject(properties={'a': JSONSchemaOOP.JSONNumber()},
+                                 additional_properties={'type': 'number'}),
+        JSONSchemaOOP.JSONArray(items=[JSONSchemaOOP.JSONNumber()],
+                                additional_items={'type': 'number'}),
+    ])
+    def test_impossible_schema(self, json_type):
+        with pytest.raises(ValueError):
+            PayloadGenerator(json_type).generate()
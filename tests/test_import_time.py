@@ -0,0 +1,32 @@
+# coding: utf-8
+
+import sys
+
+import pytest
+
+from benchmarks.bench_import_time import IMPORT_TIME_BUDGET_US, import_times, \
+    package_import_time
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7), reason='requires -X importtime')
+
+
+class TestImportTime(object):
+    def test_validator_backend_is_not_imported(self):
+        times = import_times()
+
+        assert 'jsonschemaoop.JSONSchemaOOP' in times
+        assert 'jsonschema' not in times
+        assert 'jsonschemaoop.validators' not in times
+        assert 'json' not in times
+        assert 'threading' not in times
+
+    def test_import_time_budget(self):
+        total = min(package_import_time(import_times()) for _ in range(3))
+
+        assert total < IMPORT_TIME_BUDGET_US
+
+    def test_generator_does_not_import_validator_backend(self):
+        times = import_times('jsonschemaoop.generator')
+
+        assert 'jsonschemaoop.generator' in times
+        assert 'jsonschema' not in times
@@ -73,6 +73,8 @@ class TestJSONType(object):
         ({}, {'type': 'array'}),
         ({'items': [JSONSchemaOOP.JSONString()]},
          {'items': [{'type': 'string'}], 'type': 'array'}),
+        ({'items': JSONSchemaOOP.JSONString()},
+         {'items': {'type': 'string'}, 'type': 'array'}),
         ({'unique_items': True}, {'uniqueItems': True, 'type': 'array'}),
         ({'min_items': True}, {'minItems': True, 'type': 'array'}),
         ({'max_items': True}, {'maxItems': True, 'type': 'array'}),
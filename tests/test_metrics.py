@@ -0,0 +1,147 @@
+# coding: utf-8
+
+import subprocess
+import sys
+import threading
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from jsonschemaoop import JSONSchemaOOP, metrics
+
+
+class NameSchema(JSONSchemaOOP.JSONSchema):
+    required = ['name']
+    properties = {
+        'name': JSONSchemaOOP.JSONString()
+    }
+
+
+class TagsSchema(JSONSchemaOOP.JSONSchema):
+    properties = {
+        'tags': JSONSchemaOOP.JSONArray(items=JSONSchemaOOP.JSONString())
+    }
+
+
+@pytest.fixture
+def registry():
+    yield metrics.enable()
+    metrics.disable()
+
+
+class TestMetrics(object):
+    def test_disabled(self):
+        NameSchema().validate({'name': 'john'})
+
+        assert metrics.registry is None
+        assert metrics.snapshot() == {}
+
+    def test_counts_per_schema_class(self):
+        metrics.enable(metrics.MetricsRegistry(payload_size=True))
+        try:
+            self._validate_all()
+            snapshot = metrics.snapshot()
+        finally:
+            metrics.disable()
+
+        name_stats = snapshot['tests.test_metrics.NameSchema']
+        assert name_stats['count'] == 3
+        assert name_stats['failures'] == 1
+        assert name_stats['payload_bytes'] == len('{"name":"john"}') * 2 + len('{}')
+        assert sum(name_stats['latency_ns']['buckets'].values()) == 3
+        assert name_stats['latency_ns']['p50'] <= name_stats['latency_ns']['p99']
+
+        tags_stats = snapshot['tests.test_metrics.TagsSchema']
+        assert tags_stats['count'] == 1
+        assert tags_stats['failures'] == 0
+
+    def _validate_all(self):
+        NameSchema().validate({'name': 'john'})
+        NameSchema().validate({'name': 'jane'})
+        with pytest.raises(ValidationError):
+            NameSchema().validate({})
+        TagsSchema().validate({'tags': ['a']})
+
+    def test_payload_size_disabled_by_default(self, registry):
+        NameSchema().validate({'name': 'john'})
+
+        assert metrics.snapshot()['tests.test_metrics.NameSchema']['payload_bytes'] == 0
+
+    @pytest.mark.parametrize(('nanoseconds', 'expected'), [
+        (0, 1),
+        (1000, 1024),
+        (1000000, 1048576),
+        (10 ** 15, 2 ** (metrics.LATENCY_BUCKETS - 1)),
+    ])
+    def test_latency_buckets(self, registry, nanoseconds, expected):
+        registry.record(NameSchema(), {}, nanoseconds, failed=False)
+
+        latency = metrics.snapshot()['tests.test_metrics.NameSchema']['latency_ns']
+
+        assert latency['buckets'] == {expected: 1}
+        assert latency['p50'] == latency['p99'] == expected
+
+    def test_percentiles(self, registry):
+        for _ in range(98):
+            registry.record(NameSchema(), {}, 1000, failed=False)
+        for _ in range(2):
+            registry.record(NameSchema(), {}, 1000000, failed=False)
+
+        latency = metrics.snapshot()['tests.test_metrics.NameSchema']['latency_ns']
+
+        assert latency['p50'] == 1024
+        assert latency['p99'] == 1048576
+
+    def test_threads(self, registry):
+        def validate():
+            for _ in range(50):
+                NameSchema().validate({'name': 'john'})
+
+        threads = [threading.Thread(target=validate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.snapshot()['tests.test_metrics.NameSchema']['count'] == 200
+
+    def test_ended_threads_are_folded(self, registry):
+        def validate():
+            NameSchema().validate({'name': 'john'})
+
+        for _ in range(20):
+            thread = threading.Thread(target=validate)
+            thread.start()
+            thread.join()
+
+        assert len(registry._thread_stats) <= 1
+        assert metrics.snapshot()['tests.test_metrics.NameSchema']['count'] == 20
+
+        registry.reset()
+
+        assert metrics.snapshot() == {}
+
+    def test_reset(self, registry):
+        NameSchema().validate({'name': 'john'})
+
+        registry.reset()
+
+        assert registry.snapshot() == {}
+
+    def test_first_sample_excludes_backend_import(self):
+        # A fresh interpreter, so the first validate imports jsonschema
+        script = (
+            "from jsonschemaoop import JSONSchemaOOP, metrics\n"
+            "metrics.enable()\n"
+            "JSONSchemaOOP.JSONSchema().validate({})\n"
+            "print(metrics.snapshot()['jsonschemaoop.JSONSchemaOOP.JSONSchema']"
+            "['latency_ns']['p99'])\n"
+        )
+        import_ns = int(subprocess.check_output([
+            sys.executable, '-c', 'import time; s = time.perf_counter_ns(); import jsonschema; '
+                                  'print(time.perf_counter_ns() - s)'
+        ]))
+
+        latency_ns = int(subprocess.check_output([sys.executable, '-c', script]))
+
+        assert latency_ns < import_ns
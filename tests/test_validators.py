@@ -0,0 +1,125 @@
+# coding: utf-8
+
+import pytest
+from jsonschema import Draft4Validator
+from jsonschema.exceptions import ValidationError
+
+from jsonschemaoop import JSONSchemaOOP
+from jsonschemaoop.validators import JSONSchemaValidator, find_duplicate
+
+
+class TestFindDuplicate(object):
+    @pytest.mark.parametrize(('items', 'expected'), [
+        ([], None),
+        ([1, 2, 3], None),
+        ([1, 2, 1], (0, 2)),
+        (['a', 'b', 'b', 'a'], (1, 2)),
+        ([1, 1.0], (0, 1)),
+        ([1, True], None),
+        ([0, False], None),
+        ([True, True], (0, 1)),
+        ([None, None], (0, 1)),
+        ([[1, True], [1, 1]], None),
+        ([[1, 2], [1, 2]], (0, 1)),
+        ([[1, 2], [2, 1]], None),
+        ([{'a': 1, 'b': [1]}, {'b': [1.0], 'a': 1}], (0, 1)),
+        ([{'a': True}, {'a': 1}], None),
+        ([{'a': 1}, {'a': 1, 'b': 2}], None),
+        ([{'a': {1, 2}}, 1, {'a': {2, 1}}], (0, 2)),
+        ([{1}, {2}], None),
+        ([1, 'a', {'a': 1}, True, 1.0], (0, 4)),
+        (['1', 1, [1], True], None),
+        ([0.5, 'b', 0.5], (0, 2)),
+    ])
+    def test_find_duplicate(self, items, expected):
+        assert find_duplicate(items) == expected
+
+    def test_find_duplicate_large(self):
+        items = [{'id': i, 'tags': [i, str(i)]} for i in range(100000)]
+        items.append({'tags': [5, '5'], 'id': 5})
+
+        assert find_duplicate(items) == (5, 100000)
+
+
+class TestUniqueItems(object):
+    @pytest.mark.parametrize(('data', 'is_valid'), [
+        ({'tags': [{'a': 1}, {'a': 2}]}, True),
+        ({'tags': [1, True]}, True),
+        ({'tags': [{'a': 1}, {'a': 1}]}, False),
+        ({'tags': [1, 1.0]}, False),
+    ])
+    def test_unique_items(self, data, is_valid):
+        class MySchema(JSONSchemaOOP.JSONSchema):
+            properties = {
+                'tags': JSONSchemaOOP.JSONArray(unique_items=True)
+            }
+
+        inst = MySchema()
+
+        if is_valid:
+            inst.validate(data)
+        else:
+            with pytest.raises(ValidationError):
+                inst.validate(data)
+
+    def test_unique_items_reports_indexes(self):
+        class MySchema(JSONSchemaOOP.JSONSchema):
+            properties = {
+                'tags': JSONSchemaOOP.JSONArray(unique_items=True)
+            }
+
+        with pytest.raises(ValidationError) as excinfo:
+            MySchema().validate({'tags': ['a', 'b', 'c', 'b']})
+
+        assert '(items 1 and 3 are equal)' in excinfo.value.message
+        assert list(excinfo.value.path) == ['tags']
+
+
+def errors(validator, schema, data):
+    return [
+        (error.message, list(error.path), list(error.schema_path))
+        for error in validator(schema).iter_errors(data)
+    ]
+
+
+class TestHomogeneousItems(object):
+    @pytest.mark.parametrize(('items', 'data'), [
+        (JSONSchemaOOP.JSONNumber(), []),
+        (JSONSchemaOOP.JSONNumber(), [1, 2.5, -3]),
+        (JSONSchemaOOP.JSONNumber(), [1, '2', None]),
+        (JSONSchemaOOP.JSONNumber(), [1, True]),
+        (JSONSchemaOOP.JSONNumber(minimum=1, maximum=10), [1, 5, 10]),
+        (JSONSchemaOOP.JSONNumber(minimum=1, maximum=10), [0, 5, 11, 12]),
+        (JSONSchemaOOP.JSONNumber(minimum=1), [float('nan'), 0]),
+        (JSONSchemaOOP.JSONNumber(multiple_of=2), [2, 4, 6.0]),
+        (JSONSchemaOOP.JSONNumber(multiple_of=2), [2, 3, 5.5]),
+        (JSONSchemaOOP.JSONNumber(multiple_of=0.5), [1, 1.5, 2]),
+        (JSONSchemaOOP.JSONNumber(multiple_of=0.5), [1, 1.25]),
+        (JSONSchemaOOP.JSONString(), ['a', 'bc']),
+        (JSONSchemaOOP.JSONString(), ['a', 1]),
+        (JSONSchemaOOP.JSONString(min_length=2, max_length=3), ['ab', 'abc']),
+        (JSONSchemaOOP.JSONString(min_length=2, max_length=3), ['a', 'abc', 'abcd']),
+        (JSONSchemaOOP.JSONString(pattern='^a'), ['ab', 'ba']),
+        (JSONSchemaOOP.JSONType(JSONSchemaOOP.JSONNumber(), JSONSchemaOOP.JSONString()),
+         [1, 'a', None]),
+        ([JSONSchemaOOP.JSONNumber(maximum=1)], [1, 2, 3]),
+    ])
+    def test_errors_match_draft4(self, items, data):
+        schema = JSONSchemaOOP.JSONArray(items=items).render()
+
+        expected = errors(Draft4Validator, schema, data)
+
+        assert errors(JSONSchemaValidator, schema, data) == expected
+
+    @pytest.mark.parametrize(('items', 'data'), [
+        (JSONSchemaOOP.JSONNumber(minimum=1, maximum=10, multiple_of=0.5), [1, 5.5, 10]),
+        (JSONSchemaOOP.JSONString(min_length=2, max_length=3), ['ab', 'abc']),
+    ])
+    def test_valid_arrays_skip_per_item_validation(self, monkeypatch, items, data):
+        def draft4_items(*args):
+            raise AssertionError('per-item validation called')
+
+        monkeypatch.setattr('jsonschemaoop.validators._draft4_items', draft4_items)
+        schema = JSONSchemaOOP.JSONArray(items=items).render()
+
+        JSONSchemaValidator(schema).validate(data)